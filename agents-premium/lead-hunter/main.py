@@ -10,15 +10,22 @@ Usage:
 """
 
 import argparse
-import json
+import hashlib
 import logging
+import math
 import os
+import sqlite3
+import struct
 import sys
-import hashlib
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import List, Optional
 
+import orjson
 import toml
 
 # Add parent directory to path for imports
@@ -51,98 +58,293 @@ def setup_logging(config: dict):
     return logging.getLogger("lead-hunter")
 
 
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+    No false negatives, so a miss proves a URL was never added.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, item: str):
+        """Bit positions for an item (double hashing over one blake2b digest)."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
 class LeadMemory:
     """
     Manages lead storage and deduplication.
-    Uses local JSON file for persistence (can be upgraded to shared memory).
+    Uses a local SQLite database keyed on URL for persistence (can be upgraded
+    to shared memory).
+    """
+    
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS leads (
+            url TEXT PRIMARY KEY,
+            title TEXT,
+            location TEXT,
+            description TEXT,
+            budget TEXT,
+            posted_time TEXT,
+            source TEXT,
+            added REAL
+        );
+        CREATE INDEX IF NOT EXISTS leads_added ON leads(added);
     """
     
+    # Recently seen URLs kept in process to skip the database lookup
+    SEEN_CACHE_SIZE = 100_000
+    
+    # Bloom filter sizing (~1.2 MB at 1% false positives)
+    BLOOM_CAPACITY = 1_000_000
+    # num_bits, num_hashes, row count, max(added), URLs added since the last rebuild
+    _BLOOM_HEADER = struct.Struct("<QQQdQ")
+    
+    _INSERT = (
+        "INSERT OR IGNORE INTO leads "
+        "(url, title, location, description, budget, posted_time, source, added) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    
     def __init__(self, config: dict):
         self.config = config
         storage_config = config.get("storage", {})
         self.namespace = storage_config.get("namespace", "andor-design")
         self.retention_days = storage_config.get("dedup_retention_days", 30)
         
-        # Memory file path
+        # Memory file paths
         self.memory_dir = Path(__file__).parent / "memory"
         self.memory_dir.mkdir(exist_ok=True)
-        self.memory_file = self.memory_dir / "leads.json"
+        self.db_file = self.memory_dir / "leads.db"
+        self.bloom_file = self.memory_dir / "leads.bloom"
+        
+        # Autocommit mode; batches open their own transaction
+        self.db = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(self._SCHEMA)
         
-        # Load existing memory
-        self.seen_urls: Set[str] = set()
-        self.leads: Dict[str, dict] = {}
-        self._load_memory()
+        # Bounded LRU of URLs known to be in the database (OrderedDict as an ordered set)
+        self.seen_urls: "OrderedDict[str, None]" = OrderedDict()
+        
+        self._migrate_json_memory()
+        
+        # Negative-lookup gate, checked against the database as flush() left it
+        self.bloom = self._load_bloom()
+        if self.bloom is None:
+            self._rebuild_bloom()
+        
+        # Clean up old entries; expired URLs only leave harmless false positives in the bloom
+        if self._cleanup_old_leads():
+            self._bloom_dirty = True
     
-    def _load_memory(self):
-        """Load memory from disk."""
-        if self.memory_file.exists():
-            try:
-                with open(self.memory_file, "r") as f:
-                    data = json.load(f)
-                    self.seen_urls = set(data.get("seen_urls", []))
-                    self.leads = data.get("leads", {})
-                    
-                # Clean up old entries
-                self._cleanup_old_leads()
-                
-            except Exception as e:
-                logging.warning(f"Failed to load memory: {e}")
-    
-    def _save_memory(self):
-        """Save memory to disk."""
+    def _bloom_stamp(self) -> tuple:
+        """Database state the bloom file must match to be reused."""
+        count, max_added = self.db.execute("SELECT COUNT(*), MAX(added) FROM leads").fetchone()
+        return count, max_added or 0.0
+    
+    def _load_bloom(self) -> Optional[BloomFilter]:
+        """Load leads.bloom if it was saved for the current database contents."""
+        bloom = BloomFilter(self.BLOOM_CAPACITY)
         try:
-            with open(self.memory_file, "w") as f:
-                json.dump({
-                    "seen_urls": list(self.seen_urls),
-                    "leads": self.leads,
-                    "updated": datetime.now().isoformat(),
-                }, f, indent=2)
-        except Exception as e:
-            logging.error(f"Failed to save memory: {e}")
+            with open(self.bloom_file, "rb") as f:
+                header = f.read(self._BLOOM_HEADER.size)
+                bits = f.read()
+        except OSError:
+            return None
+        
+        if len(header) != self._BLOOM_HEADER.size or len(bits) != len(bloom.bits):
+            return None
+        num_bits, num_hashes, count, max_added, inserted = self._BLOOM_HEADER.unpack(header)
+        if (num_bits, num_hashes) != (bloom.num_bits, bloom.num_hashes):
+            return None
+        if (count, max_added) != self._bloom_stamp():
+            return None
+        # Past capacity the false positive rate climbs; start over from the live rows
+        if inserted > self.BLOOM_CAPACITY:
+            return None
+        
+        bloom.bits[:] = bits
+        self._bloom_inserted = inserted
+        self._bloom_dirty = False
+        return bloom
+    
+    def _rebuild_bloom(self):
+        """Rebuild the bloom filter from every URL in the database."""
+        self.bloom = BloomFilter(self.BLOOM_CAPACITY)
+        self._bloom_inserted = 0
+        for (url,) in self.db.execute("SELECT url FROM leads"):
+            self.bloom.add(url)
+            self._bloom_inserted += 1
+        self._bloom_dirty = True
     
-    def _cleanup_old_leads(self):
-        """Remove leads older than retention period."""
-        cutoff = datetime.now() - timedelta(days=self.retention_days)
-        urls_to_remove = []
+    def flush(self):
+        """Persist the bloom filter (tagged with the database state it reflects)."""
+        if not self._bloom_dirty:
+            return
         
-        for url, lead_data in self.leads.items():
+        tmp_file = self.bloom_file.with_name(self.bloom_file.name + ".tmp")
+        header = self._BLOOM_HEADER.pack(
+            self.bloom.num_bits, self.bloom.num_hashes, *self._bloom_stamp(), self._bloom_inserted
+        )
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(header)
+                f.write(self.bloom.bits)
+            os.replace(tmp_file, self.bloom_file)
+            self._bloom_dirty = False
+        except OSError as e:
+            logging.error(f"Failed to save bloom filter: {e}")
+    
+    def _migrate_json_memory(self):
+        """Import leads.json / leads.log written by older versions, then set them aside."""
+        snapshot_file = self.memory_dir / "leads.json"
+        log_file = self.memory_dir / "leads.log"
+        if not snapshot_file.exists() and not log_file.exists():
+            return
+        
+        records = []
+        try:
+            if snapshot_file.exists():
+                with open(snapshot_file, "rb") as f:
+                    records.extend(orjson.loads(f.read()).get("leads", {}).values())
+            if log_file.exists():
+                with open(log_file, "rb") as f:
+                    for line in f:
+                        try:
+                            records.append(orjson.loads(line))
+                        except ValueError:
+                            continue
+        except Exception as e:
+            logging.warning(f"Failed to load legacy memory: {e}")
+            return
+        
+        rows = []
+        skipped = 0
+        for record in records:
             try:
-                added = datetime.fromisoformat(lead_data.get("added", ""))
-                if added < cutoff:
-                    urls_to_remove.append(url)
-            except:
-                pass
+                lead = Lead.from_dict(record)
+            except (KeyError, TypeError, AttributeError):
+                # Incomplete or non-object record; don't let it block startup
+                skipped += 1
+                continue
+            try:
+                added = datetime.fromisoformat(record.get("added", "")).timestamp()
+            except (TypeError, ValueError):
+                added = time.time()
+            rows.append(self._row(lead, added))
+        
+        if skipped:
+            logging.warning(f"Skipped {skipped} malformed leads in legacy memory")
         
-        for url in urls_to_remove:
-            self.seen_urls.discard(url)
-            del self.leads[url]
+        with self.db:
+            self.db.execute("BEGIN")
+            self.db.executemany(self._INSERT, rows)
         
-        if urls_to_remove:
-            logging.info(f"Cleaned up {len(urls_to_remove)} old leads from memory")
+        for path in (snapshot_file, log_file):
+            if path.exists():
+                path.rename(path.with_name(path.name + ".migrated"))
+        
+        logging.info(f"Migrated {len(rows)} leads from JSON memory to {self.db_file.name}")
     
-    def is_new(self, lead_data: dict) -> bool:
-        """Check if a lead is new (not seen before)."""
-        url = lead_data.get("url", "")
-        return url not in self.seen_urls
+    @staticmethod
+    def _row(lead: Lead, added: float) -> tuple:
+        """Build the leads table row for a lead."""
+        return (
+            lead.url,
+            lead.title,
+            lead.location,
+            lead.description,
+            lead.budget,
+            lead.posted_time,
+            lead.source,
+            added,
+        )
     
-    def add_lead(self, lead: Lead) -> bool:
-        """Add a lead to memory. Returns True if new, False if duplicate."""
+    def _cleanup_old_leads(self) -> int:
+        """Remove leads older than retention period. Returns the number removed."""
+        # added is stored as a Unix timestamp, so the cutoff is plain float arithmetic
+        cutoff = time.time() - self.retention_days * 86400
+        removed = self.db.execute("DELETE FROM leads WHERE added < ?", (cutoff,)).rowcount
+        
+        if removed:
+            logging.info(f"Cleaned up {removed} old leads from memory")
+            # Expired URLs may still be cached
+            self.seen_urls.clear()
+        
+        return removed
+    
+    def _remember(self, url: str):
+        """Mark a URL as recently seen, evicting the least recently used past the cap."""
+        self.seen_urls[url] = None
+        if len(self.seen_urls) > self.SEEN_CACHE_SIZE:
+            self.seen_urls.popitem(last=False)
+    
+    def is_new(self, lead: Lead) -> bool:
+        """Check if a lead is new (not seen before)."""
+        # Bloom miss: definitely never stored
+        if lead.url not in self.bloom:
+            return True
+        
         if lead.url in self.seen_urls:
+            self.seen_urls.move_to_end(lead.url)
             return False
         
-        self.seen_urls.add(lead.url)
-        self.leads[lead.url] = {
-            **lead.to_dict(),
-            "added": datetime.now().isoformat(),
-            "hash": self._hash_lead(lead),
-        }
-        self._save_memory()
-        return True
+        row = self.db.execute("SELECT 1 FROM leads WHERE url = ? LIMIT 1", (lead.url,)).fetchone()
+        if row is None:
+            return True
+        
+        self._remember(lead.url)
+        return False
+    
+    def add_lead(self, lead: Lead) -> bool:
+        """Add a lead to memory. Returns True if new, False if duplicate."""
+        return bool(self.add_leads_bulk([lead]))
     
-    def _hash_lead(self, lead: Lead) -> str:
-        """Generate a hash for the lead for deduplication."""
-        content = f"{lead.title}|{lead.url}|{lead.location}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+    def add_leads_bulk(self, leads: List[Lead]) -> List[Lead]:
+        """Add several leads in one transaction. Returns the ones that were new."""
+        added = time.time()
+        new_leads = []
+        
+        try:
+            with self.db:
+                self.db.execute("BEGIN")
+                for lead in leads:
+                    if lead.url in self.seen_urls:
+                        self.seen_urls.move_to_end(lead.url)
+                        continue
+                    # The url primary key makes duplicates a no-op
+                    if self.db.execute(self._INSERT, self._row(lead, added)).rowcount:
+                        new_leads.append(lead)
+        except sqlite3.Error as e:
+            logging.error(f"Failed to save memory: {e}")
+            return []
+        
+        # Cache only once committed, so a rolled-back batch isn't remembered
+        for lead in leads:
+            self._remember(lead.url)
+        for lead in new_leads:
+            self.bloom.add(lead.url)
+        self._bloom_inserted += len(new_leads)
+        if new_leads:
+            self._bloom_dirty = True
+        
+        return new_leads
 
 
 class LeadHunter:
@@ -155,6 +357,8 @@ class LeadHunter:
 
         self.memory = LeadMemory(self.config)
         self.notifier = Notifier(self.config)
+        # Scrapers run in parallel; guards stats, memory and the notifier
+        self._lock = threading.Lock()
 
         # Load exclude keywords for filtering
         self.exclude_keywords = self.config.get("search", {}).get("exclude_keywords", [])
@@ -171,10 +375,10 @@ class LeadHunter:
             "sources": [],
         }
 
-    def _is_job_posting(self, lead_data: dict) -> bool:
+    def _is_job_posting(self, lead: Lead) -> bool:
         """Check if a lead looks like a job posting (hiring workers, not seeking services)."""
-        title = lead_data.get("title", "").lower()
-        description = lead_data.get("description", "").lower()
+        title = lead.title.lower()
+        description = lead.description.lower()
         combined = f"{title} {description}"
 
         for keyword in self.exclude_keywords:
@@ -202,10 +406,10 @@ class LeadHunter:
 
         return False
 
-    def _is_service_ad(self, lead_data: dict) -> bool:
+    def _is_service_ad(self, lead: Lead) -> bool:
         """Check if a lead is a service advertisement (not a homeowner seeking help)."""
-        title = lead_data.get("title", "").lower()
-        description = lead_data.get("description", "").lower()
+        title = lead.title.lower()
+        description = lead.description.lower()
         combined = f"{title} {description}"
 
         for keyword in self.exclude_service_keywords:
@@ -249,11 +453,17 @@ class LeadHunter:
         
         start_time = datetime.now()
         
-        # Run all enabled scrapers
-        self._run_rss()
-        self._run_kijiji()
-        self._run_facebook()  # Stub
-        self._run_municipal()  # Stub
+        # Run all enabled scrapers concurrently (network-bound)
+        scrapers = (
+            self._run_rss,
+            self._run_kijiji,
+            self._run_facebook,  # Stub
+            self._run_municipal,  # Stub
+        )
+        with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+            futures = [executor.submit(run_scraper) for run_scraper in scrapers]
+            for future in as_completed(futures):
+                future.result()
         
         # Send summary
         self.stats["duration"] = str(datetime.now() - start_time)
@@ -261,6 +471,9 @@ class LeadHunter:
         
         if not self.dry_run and self.stats["new_leads"] > 0:
             self.notifier.send_summary(self.stats)
+        # Release the queue file so openclaw_runner can move it aside between runs
+        self.notifier.close()
+        self.memory.flush()
         
         self.logger.info("Lead Hunter finished")
         return self.stats
@@ -268,48 +481,22 @@ class LeadHunter:
     def _run_kijiji(self):
         """Run Kijiji scraper."""
         self.logger.info("Running Kijiji scraper...")
-        self.stats["sources"].append("kijiji")
+        with self._lock:
+            self.stats["sources"].append("kijiji")
 
+        new_batch: List[Lead] = []
         try:
-            for lead_data in scrape_kijiji(self.config):
-                # Filter out job postings
-                if self._is_job_posting(lead_data):
-                    self.stats["filtered_out"] += 1
-                    self.logger.debug(f"Filtered job posting: {lead_data.get('title', '')[:50]}...")
-                    continue
-
-                # Filter out service ads (businesses offering services)
-                if self._is_service_ad(lead_data):
-                    self.stats["filtered_out"] += 1
-                    self.logger.debug(f"Filtered service ad: {lead_data.get('title', '')[:50]}...")
-                    continue
-
-                self.stats["total_found"] += 1
-
-                lead = Lead(
-                    title=lead_data.get("title", "Unknown"),
-                    url=lead_data.get("url", ""),
-                    location=lead_data.get("location", ""),
-                    description=lead_data.get("description", ""),
-                    budget=lead_data.get("budget"),
-                    posted_time=lead_data.get("posted_time"),
-                    source="kijiji",
-                )
-
-                if self.memory.add_lead(lead):
-                    self.stats["new_leads"] += 1
-                    self.logger.info(f"New lead: {lead.title[:50]}...")
-
-                    if not self.dry_run:
-                        if self.notifier.send_lead(lead):
-                            self.stats["notified"] += 1
-                else:
-                    self.stats["duplicates"] += 1
-                    self.logger.debug(f"Duplicate: {lead.title[:50]}...")
+            for lead in scrape_kijiji(self.config):
+                if self._accept_lead(lead):
+                    new_batch.append(lead)
 
         except Exception as e:
             self.logger.error(f"Kijiji scraper error: {e}")
-            self.stats["errors"] += 1
+            with self._lock:
+                self.stats["errors"] += 1
+
+        # Store and notify whatever was collected, even after a scraper error
+        self._store_leads(new_batch)
 
     def _run_rss(self):
         """Run RSS feed scraper (Google Alerts, etc.)."""
@@ -321,48 +508,59 @@ class LeadHunter:
             return
 
         self.logger.info(f"Running RSS scraper ({len(feeds)} feeds)...")
-        self.stats["sources"].append("rss")
+        with self._lock:
+            self.stats["sources"].append("rss")
 
+        new_batch: List[Lead] = []
         try:
-            for lead_data in scrape_rss(self.config):
-                # Filter out job postings
-                if self._is_job_posting(lead_data):
-                    self.stats["filtered_out"] += 1
-                    self.logger.debug(f"Filtered job posting: {lead_data.get('title', '')[:50]}...")
-                    continue
-
-                # Filter out service ads
-                if self._is_service_ad(lead_data):
-                    self.stats["filtered_out"] += 1
-                    self.logger.debug(f"Filtered service ad: {lead_data.get('title', '')[:50]}...")
-                    continue
-
-                self.stats["total_found"] += 1
-
-                lead = Lead(
-                    title=lead_data.get("title", "Unknown"),
-                    url=lead_data.get("url", ""),
-                    location=lead_data.get("location", ""),
-                    description=lead_data.get("description", ""),
-                    budget=lead_data.get("budget"),
-                    posted_time=lead_data.get("posted_time"),
-                    source=lead_data.get("source", "rss"),
-                )
-
-                if self.memory.add_lead(lead):
-                    self.stats["new_leads"] += 1
-                    self.logger.info(f"New lead: {lead.title[:50]}...")
-
-                    if not self.dry_run:
-                        if self.notifier.send_lead(lead):
-                            self.stats["notified"] += 1
-                else:
-                    self.stats["duplicates"] += 1
-                    self.logger.debug(f"Duplicate: {lead.title[:50]}...")
+            for lead in scrape_rss(self.config):
+                if self._accept_lead(lead):
+                    new_batch.append(lead)
 
         except Exception as e:
             self.logger.error(f"RSS scraper error: {e}")
-            self.stats["errors"] += 1
+            with self._lock:
+                self.stats["errors"] += 1
+
+        self._store_leads(new_batch)
+
+    def _accept_lead(self, lead: Lead) -> bool:
+        """Dedup and filter a scraped lead, updating stats. Returns True to keep it."""
+        with self._lock:
+            # Known URLs already passed the filters when first stored
+            if not self.memory.is_new(lead):
+                self.stats["total_found"] += 1
+                self.stats["duplicates"] += 1
+                self.logger.debug(f"Duplicate: {lead.title[:50]}...")
+                return False
+
+            # Filter out job postings
+            if self._is_job_posting(lead):
+                self.stats["filtered_out"] += 1
+                self.logger.debug(f"Filtered job posting: {lead.title[:50]}...")
+                return False
+
+            # Filter out service ads (businesses offering services)
+            if self._is_service_ad(lead):
+                self.stats["filtered_out"] += 1
+                self.logger.debug(f"Filtered service ad: {lead.title[:50]}...")
+                return False
+
+            self.stats["total_found"] += 1
+            return True
+
+    def _store_leads(self, leads: List[Lead]):
+        """Record a source's leads in memory in one write and notify the new ones."""
+        with self._lock:
+            new_leads = self.memory.add_leads_bulk(leads)
+            self.stats["new_leads"] += len(new_leads)
+            self.stats["duplicates"] += len(leads) - len(new_leads)
+
+            for lead in new_leads:
+                self.logger.info(f"New lead: {lead.title[:50]}...")
+
+            if new_leads and not self.dry_run:
+                self.stats["notified"] += self.notifier.send_batch(new_leads)
     
     def _run_facebook(self):
         """Run Facebook scraper (stub)."""
@@ -391,24 +589,82 @@ class LeadHunter:
     
     def run_scheduled(self):
         """Run in scheduled mode (daemon)."""
-        import schedule
-        import time
-        
-        cron = self.config.get("schedule", {}).get("cron", "0 6 * * *")
-        
-        # Parse cron (simplified - just handles "H M * * *" format)
-        parts = cron.split()
-        if len(parts) == 5:
-            minute, hour = parts[0], parts[1]
-            
-            # Schedule daily at specified time
-            schedule.every().day.at(f"{hour.zfill(2)}:{minute.zfill(2)}").do(self.run)
-            
-            self.logger.info(f"Scheduled to run daily at {hour}:{minute}")
-            
-            while True:
-                schedule.run_pending()
-                time.sleep(60)
+        from apscheduler.schedulers.blocking import BlockingScheduler
+        
+        schedule_config = self.config.get("schedule", {})
+        cron = schedule_config.get("cron", "0 6 * * *")
+        jitter = schedule_config.get("jitter", 0)
+        
+        try:
+            trigger = _cron_trigger(cron, jitter=jitter or None)
+        except ValueError as e:
+            self.logger.error(f"Invalid schedule cron '{cron}': {e}")
+            return
+        
+        # Sleeps until the next fire time instead of polling
+        scheduler = BlockingScheduler()
+        scheduler.add_job(self.run, trigger, coalesce=True, max_instances=1)
+        
+        self.logger.info(f"Scheduled with cron '{cron}' (jitter {jitter}s)")
+        scheduler.start()
+
+
+# Cron day-of-week numbers (0 and 7 are Sunday); APScheduler reads bare numbers as 0 = Monday
+_CRON_DAY_NAMES = ("sun", "mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+def _cron_day_of_week(field: str) -> str:
+    """Rewrite a crontab day-of-week field as an explicit list of day names."""
+    parts = []
+    for part in field.split(","):
+        days, slash, step = part.partition("/")
+        start, dash, end = days.partition("-")
+        if days != "*" and (not start.isdigit() or (dash and not end.isdigit())):
+            # Names already mean the same to APScheduler
+            parts.append(part)
+            continue
+        
+        # "*" and a bare start with a step ("*/2", "0/2", "1/2") run to Saturday
+        if days == "*":
+            first, last = 0, 6
+        else:
+            first = int(start)
+            last = int(end) if dash else (6 if slash else first)
+        if not step.isdigit() and slash:
+            raise ValueError(f"invalid step: {part}")
+        if last > 7 or first > last:
+            raise ValueError(f"day of week out of range: {part}")
+        if days == "*" and not slash:
+            parts.append("*")
+            continue
+        
+        # Expanded to single days, so neither steps nor ranges are read in
+        # APScheduler's Monday-first order
+        for day in range(first, last + 1, int(step) if slash else 1):
+            parts.append(_CRON_DAY_NAMES[day])
+    return ",".join(dict.fromkeys(parts))
+
+
+def _cron_trigger(cron: str, jitter: int = None):
+    """Build an APScheduler CronTrigger from a standard 5-field crontab string."""
+    from apscheduler.triggers.cron import CronTrigger
+    
+    fields = cron.split()
+    if len(fields) != 5:
+        raise ValueError("expected 5 fields")
+    
+    minute, hour, day, month, day_of_week = fields
+    if day != "*" and day_of_week != "*":
+        # cron fires when either day field matches; APScheduler requires both
+        raise ValueError("restricting both day-of-month and day-of-week is not supported")
+    return CronTrigger(
+        minute=minute,
+        hour=hour,
+        day=day,
+        month=month,
+        day_of_week=_cron_day_of_week(day_of_week),
+        jitter=jitter,
+    )
 
 
 def main():
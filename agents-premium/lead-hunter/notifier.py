@@ -4,71 +4,19 @@ Sends lead notifications via WhatsApp through OpenClaw message tool.
 """
 
 import subprocess
-import json
 import logging
-from typing import Optional
-from dataclasses import dataclass
+import os
+from datetime import datetime
+from typing import BinaryIO, List, Optional
 
-logger = logging.getLogger(__name__)
+import orjson
 
+from sources.lead import Lead
 
-@dataclass
-class Lead:
-    """Represents a discovered lead."""
-    title: str
-    url: str
-    location: str
-    description: str
-    posted_time: Optional[str] = None
-    budget: Optional[str] = None
-    source: str = "kijiji"
-    
-    def to_notification(self) -> str:
-        """Format lead as WhatsApp notification message."""
-        lines = [
-            f"🏠 New Lead: {self.title}",
-            f"📍 Location: {self.location}",
-            f"🔗 Link: {self.url}",
-        ]
-        
-        if self.budget:
-            lines.append(f"💰 Budget: {self.budget}")
-        
-        # Truncate description to ~200 chars for readability
-        desc = self.description[:200] + "..." if len(self.description) > 200 else self.description
-        lines.append(f"📝 Description: {desc}")
-        
-        if self.posted_time:
-            lines.append(f"⏰ Posted: {self.posted_time}")
-        
-        lines.append(f"🔍 Source: {self.source}")
-        
-        return "\n".join(lines)
-    
-    def to_dict(self) -> dict:
-        """Convert to dictionary for storage."""
-        return {
-            "title": self.title,
-            "url": self.url,
-            "location": self.location,
-            "description": self.description,
-            "posted_time": self.posted_time,
-            "budget": self.budget,
-            "source": self.source,
-        }
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> "Lead":
-        """Create Lead from dictionary."""
-        return cls(
-            title=data["title"],
-            url=data["url"],
-            location=data["location"],
-            description=data["description"],
-            posted_time=data.get("posted_time"),
-            budget=data.get("budget"),
-            source=data.get("source", "kijiji"),
-        )
+logger = logging.getLogger(__name__)
+
+# Pending notifications, one JSON object per line (drained by openclaw_runner)
+QUEUE_FILENAME = "pending.jsonl"
 
 
 class Notifier:
@@ -80,6 +28,11 @@ class Notifier:
         self.whatsapp_enabled = self.notifications_config.get("whatsapp", False)
         self.channel = self.notifications_config.get("channel", "webchat")
         self.recipient = self.notifications_config.get("recipient", "Jer")
+        
+        # Queue directory is created once; the queue file is opened on first use
+        self.queue_dir = os.path.join(os.path.dirname(__file__), "notifications")
+        os.makedirs(self.queue_dir, exist_ok=True)
+        self._queue_fh: Optional[BinaryIO] = None
     
     def send_lead(self, lead: Lead) -> bool:
         """Send a lead notification via configured channel."""
@@ -101,26 +54,52 @@ class Notifier:
             logger.error(f"Failed to send notification: {e}")
             return False
     
+    def send_batch(self, leads: List[Lead]) -> int:
+        """Send notifications for several leads at once. Returns the number queued."""
+        if not leads:
+            return 0
+        
+        if not self.whatsapp_enabled:
+            logger.info(f"WhatsApp notifications disabled, skipping {len(leads)} leads")
+            return 0
+        
+        try:
+            self._queue_notifications([lead.to_notification() for lead in leads])
+            logger.info(f"Queued {len(leads)} lead notifications")
+            return len(leads)
+        except Exception as e:
+            logger.error(f"Failed to send notifications: {e}")
+            return 0
+    
     def _queue_notification(self, message: str):
         """Queue notification for delivery by main agent context."""
+        self._queue_notifications([message])
+    
+    def _queue_notifications(self, messages: List[str]):
+        """Append one or more notifications to the pending JSONL queue."""
         # In OpenClaw context, this would use the message tool directly
-        # For standalone operation, write to a notification file
-        import os
-        from datetime import datetime
-        
-        queue_dir = os.path.join(os.path.dirname(__file__), "notifications")
-        os.makedirs(queue_dir, exist_ok=True)
+        # For standalone operation, append to the notification queue file
+        if self._queue_fh is None:
+            self._queue_fh = open(os.path.join(self.queue_dir, QUEUE_FILENAME), "ab")
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        queue_file = os.path.join(queue_dir, f"pending_{timestamp}.json")
-        
-        with open(queue_file, "w") as f:
-            json.dump({
+        # orjson emits UTF-8 bytes directly; one line per notification
+        self._queue_fh.write(b"".join(
+            orjson.dumps({
                 "channel": self.channel,
                 "recipient": self.recipient,
                 "message": message,
                 "timestamp": timestamp,
-            }, f, indent=2)
+            }, option=orjson.OPT_APPEND_NEWLINE)
+            for message in messages
+        ))
+        self._queue_fh.flush()
+    
+    def close(self):
+        """Close the queue file (reopened automatically on the next notification)."""
+        if self._queue_fh is not None:
+            self._queue_fh.close()
+            self._queue_fh = None
     
     def send_summary(self, stats: dict):
         """Send a summary of the lead hunting session."""
@@ -20,6 +20,8 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+
 # Add agent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -45,32 +47,68 @@ def process_notifications(notifications_dir: Path):
     """
     Process pending notifications and send via OpenClaw message tool.
     
-    This function reads notification files and outputs them in a format
-    that OpenClaw can pick up and send via the message tool.
+    This function reads the pending JSONL queue (plus any legacy
+    pending_*.json files) and outputs them in a format that OpenClaw
+    can pick up and send via the message tool.
     """
-    pending_files = sorted(notifications_dir.glob("pending_*.json"))
+    from notifier import QUEUE_FILENAME
+    
+    # Claim the queue under a unique name so new notifications start a fresh
+    # file. A claim is archived only after all of it was output, so one left
+    # behind by a crashed run is sent again rather than lost.
+    queue_file = notifications_dir / QUEUE_FILENAME
+    if queue_file.exists():
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        try:
+            queue_file.rename(notifications_dir / f"processing-{stamp}.jsonl")
+        except OSError as e:
+            print(f"Error claiming {queue_file}: {e}")
+    
+    # One directory pass; names sort chronologically
+    legacy_files = []
+    claimed_files = []
+    for entry in os.scandir(notifications_dir):
+        if entry.name.startswith("pending_") and entry.name.endswith(".json"):
+            legacy_files.append(entry.name)
+        elif entry.name.startswith("processing-") and entry.name.endswith(".jsonl"):
+            claimed_files.append(entry.name)
     
-    if not pending_files:
+    if not legacy_files and not claimed_files:
         return
     
-    print(f"Processing {len(pending_files)} pending notifications...")
+    archive_dir = notifications_dir / "sent"
+    archive_dir.mkdir(exist_ok=True)
     
-    for notif_file in pending_files:
+    # Files written by older versions: one notification per file
+    for name in sorted(legacy_files):
+        notif_file = notifications_dir / name
         try:
-            with open(notif_file, "r") as f:
-                notif = json.load(f)
+            with open(notif_file, "rb") as f:
+                notif = orjson.loads(f.read())
             
-            # Output notification for OpenClaw to pick up
-            # This will be read by the main agent context
             output_notification(notif)
             
-            # Archive the notification
-            archive_dir = notifications_dir / "sent"
-            archive_dir.mkdir(exist_ok=True)
             notif_file.rename(archive_dir / notif_file.name)
             
         except Exception as e:
             print(f"Error processing {notif_file}: {e}")
+    
+    for name in sorted(claimed_files):
+        claimed = notifications_dir / name
+        with open(claimed, "rb") as f:
+            lines = [line for line in f if line.strip()]
+        
+        print(f"Processing {len(lines)} pending notifications...")
+        
+        for line in lines:
+            try:
+                # Output notification for OpenClaw to pick up
+                # This will be read by the main agent context
+                output_notification(orjson.loads(line))
+            except Exception as e:
+                print(f"Error processing notification: {e}")
+        
+        claimed.rename(archive_dir / ("pending-" + name[len("processing-"):]))
 
 
 def output_notification(notif: dict):
@@ -2,12 +2,14 @@
 Sources package for Lead Hunter agent.
 """
 
+from .lead import Lead
 from .kijiji import KijijiScraper, scrape_kijiji
 from .facebook import FacebookScraper, scrape_facebook
 from .municipal import MunicipalScraper, scrape_municipal
 from .rss import RSSScraper, scrape_rss
 
 __all__ = [
+    "Lead",
     "KijijiScraper",
     "scrape_kijiji",
     "FacebookScraper", 
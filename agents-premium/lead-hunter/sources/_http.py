@@ -0,0 +1,83 @@
+"""
+Shared outbound HTTP for Lead Hunter sources.
+
+All async fetches run on one long-lived event loop (in a daemon thread) and go
+through one keep-alive HTTP/2 client, so RSS feeds and Kijiji searches reuse
+TCP+TLS connections across queries, sources and scheduled runs. Blocking
+sources use the pooled, retrying requests SESSION instead.
+"""
+
+import asyncio
+import atexit
+import threading
+from typing import Awaitable, Optional, TypeVar
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+T = TypeVar("T")
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0"
+
+_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+# Shared blocking session: pooled keep-alive connections, retries on transient errors
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": USER_AGENT})
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared event loop thread on first use."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="lead-hunter-http", daemon=True).start()
+        return _loop
+
+
+def run(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the shared loop and wait for it (thread-safe asyncio.run)."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient. Must be called from code running via run()."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=_LIMITS,
+            headers={"User-Agent": USER_AGENT},
+            follow_redirects=True,
+            timeout=30,
+        )
+    return _client
+
+
+def _shutdown():
+    """Close the shared client and stop the loop at interpreter exit."""
+    if _loop is None:
+        return
+    if _client is not None:
+        try:
+            run(_client.aclose())
+        except Exception:
+            pass
+    _loop.call_soon_threadsafe(_loop.stop)
+
+
+atexit.register(_shutdown)
@@ -3,33 +3,84 @@ Google Alerts RSS feed source for Lead Hunter agent.
 Fetches leads from configured Google Alerts RSS feeds.
 """
 
-import feedparser
+import json
 import requests
 import logging
-from typing import List, Generator
-from datetime import datetime
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Generator, Optional, Tuple
+from datetime import datetime, timezone
 from urllib.parse import quote_plus
+from lxml import etree
+
+from ._http import SESSION
+from .lead import Lead
 
 logger = logging.getLogger(__name__)
 
+HTTP_HEADERS = {
+    "Accept": "application/rss+xml, application/xml, text/xml, */*",
+}
+
+# Google Alerts feeds are Atom; parsed directly with lxml, feedparser is the fallback
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
+# Per-feed (ETag, Last-Modified) validators, kept between runs
+FEED_META_FILE = Path(__file__).parent.parent / "memory" / "google_alerts_feeds.json"
+
+# Ontario cities in priority order (earlier entries win when several appear)
+_ONTARIO_CITIES = (
+    "Sudbury", "North Bay", "Timmins", "Sault Ste Marie", "Sault Ste. Marie",
+    "Thunder Bay", "Elliot Lake", "Temiskaming Shores",
+    "Cochrane", "Kirkland Lake", "Hearst", "Kapuskasing", "Smooth Rock Falls",
+    "Ontario", "Toronto", "Ottawa", "Hamilton", "London", "Windsor",
+)
+_CITY_RANK = {city.lower(): rank for rank, city in enumerate(_ONTARIO_CITIES)}
+_CITY_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(city) for city in _ONTARIO_CITIES) + r")\b",
+    # ASCII-only case folding, so every match lowers to a _CITY_RANK key
+    re.IGNORECASE | re.ASCII,
+)
+
 
 class GoogleAlertsSource:
     """Fetch leads from Google Alerts RSS feeds."""
     
+    # Feeds fetched concurrently
+    MAX_WORKERS = 16
+    
     def __init__(self, config: dict):
         self.config = config
         alerts_config = config.get("google_alerts", {})
         self.feeds = alerts_config.get("feeds", [])
         self.enabled = alerts_config.get("enabled", True)
         
-        # Setup session with headers
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "application/rss+xml, application/xml, text/xml, */*",
-        })
+        # Shared pooled session (connections and retries common to all sources)
+        self.session = SESSION
+        
+        # Conditional-GET validators so unchanged feeds come back as 304
+        self._feed_meta: Dict[str, Tuple[str, str]] = self._load_feed_meta()
+    
+    def _load_feed_meta(self) -> Dict[str, Tuple[str, str]]:
+        """Load cached ETag/Last-Modified values from disk."""
+        try:
+            with open(FEED_META_FILE, "r") as f:
+                return {url: tuple(meta) for url, meta in json.load(f).items()}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_feed_meta(self):
+        """Persist ETag/Last-Modified values for the next run."""
+        try:
+            FEED_META_FILE.parent.mkdir(exist_ok=True)
+            with open(FEED_META_FILE, "w") as f:
+                json.dump(self._feed_meta, f)
+        except OSError as e:
+            logger.warning(f"Failed to save feed cache: {e}")
     
-    def search(self, keywords: List[str] = None, locations: List[str] = None) -> Generator[dict, None, None]:
+    def search(self, keywords: List[str] = None, locations: List[str] = None) -> Generator[Lead, None, None]:
         """
         Fetch leads from configured Google Alerts RSS feeds.
         
@@ -38,7 +89,7 @@ class GoogleAlertsSource:
             locations: Not used for Google Alerts (alerts are pre-configured)
         
         Yields:
-            dict: Lead data from RSS feed entries
+            Lead: Lead built from an RSS feed entry
         """
         if not self.enabled:
             logger.info("Google Alerts source is disabled")
@@ -50,14 +101,23 @@ class GoogleAlertsSource:
         
         seen_urls = set()
         
-        for feed_url in self.feeds:
-            logger.info(f"Fetching Google Alerts feed: {feed_url[:50]}...")
+        # Fetch all feeds concurrently; entries are consumed here as each feed completes
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(self.feeds))) as executor:
+            futures = {}
+            for feed_url in self.feeds:
+                logger.info(f"Fetching Google Alerts feed: {feed_url[:50]}...")
+                futures[executor.submit(self._fetch_feed, feed_url)] = feed_url
             
-            try:
-                entries = self._fetch_feed(feed_url)
+            for future in as_completed(futures):
+                feed_url = futures[future]
+                try:
+                    entries = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching Google Alerts feed {feed_url}: {e}")
+                    continue
                 
                 for entry in entries:
-                    url = entry.get("link", "")
+                    url = entry.url
                     
                     # Dedupe by URL
                     if url and url not in seen_urls:
@@ -65,28 +125,38 @@ class GoogleAlertsSource:
                         yield entry
                     else:
                         logger.debug(f"Skipping duplicate: {url}")
-                        
-            except Exception as e:
-                logger.error(f"Error fetching Google Alerts feed {feed_url}: {e}")
-                continue
+        
+        self._save_feed_meta()
     
-    def _fetch_feed(self, feed_url: str) -> List[dict]:
+    def _fetch_feed(self, feed_url: str) -> List[Lead]:
         """Fetch and parse an RSS feed."""
         try:
-            response = self.session.get(feed_url, timeout=30)
-            response.raise_for_status()
+            headers = dict(HTTP_HEADERS)
+            etag, last_modified = self._feed_meta.get(feed_url, ("", ""))
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+            
+            response = self.session.get(feed_url, timeout=30, headers=headers)
+            
+            # Unchanged since the last fetch; nothing new to parse
+            if response.status_code == 304:
+                logger.info("Feed not modified since last fetch")
+                return []
             
-            # Parse RSS feed
-            feed = feedparser.parse(response.text)
+            response.raise_for_status()
             
-            if feed.bozo and feed.bozo_exception:
-                logger.warning(f"Feed parsing warning: {feed.bozo_exception}")
+            entries = self._parse_atom(response.content)
+            if entries is None:
+                entries = self._parse_feedparser(response.content)
             
-            entries = []
-            for entry in feed.entries:
-                lead = self._parse_entry(entry)
-                if lead:
-                    entries.append(lead)
+            # Only remember the validators once the body was parsed, or a
+            # failed parse would be answered with 304 from now on
+            self._feed_meta[feed_url] = (
+                response.headers.get("ETag", ""),
+                response.headers.get("Last-Modified", ""),
+            )
             
             logger.info(f"Found {len(entries)} entries in feed")
             return entries
@@ -95,17 +165,60 @@ class GoogleAlertsSource:
             logger.error(f"Request failed for {feed_url}: {e}")
             return []
     
-    def _parse_entry(self, entry) -> dict:
-        """Parse a feed entry into a lead dict."""
-        title = entry.get("title", "")
-        link = entry.get("link", "")
+    def _parse_atom(self, content: bytes) -> Optional[List[Lead]]:
+        """Parse a Google Alerts Atom feed with lxml. Returns None if it isn't Atom."""
+        try:
+            root = etree.fromstring(content, _XML_PARSER)
+        except etree.XMLSyntaxError:
+            return None
         
-        if not title or not link:
+        if root is None or root.tag != _ATOM + "feed":
             return None
         
-        # Get description/summary
-        description = entry.get("description") or entry.get("summary") or ""
+        entries = []
+        for entry in root.iterfind(_ATOM + "entry"):
+            link_el = entry.find(_ATOM + "link")
+            published = entry.findtext(_ATOM + "published") or entry.findtext(_ATOM + "updated")
+            lead = self._make_lead(
+                title=entry.findtext(_ATOM + "title") or "",
+                link=link_el.get("href", "") if link_el is not None else "",
+                description=entry.findtext(_ATOM + "content") or entry.findtext(_ATOM + "summary") or "",
+                published=self._atom_date(published.strip()) if published else None,
+            )
+            if lead:
+                entries.append(lead)
+        return entries
+    
+    @staticmethod
+    def _atom_date(value: str) -> str:
+        """Normalize an Atom timestamp to naive UTC ISO 8601 (as the feedparser path does)."""
+        try:
+            parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+        except ValueError:
+            return value
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed.isoformat()
+    
+    def _parse_feedparser(self, content: bytes) -> List[Lead]:
+        """Parse any other RSS/Atom dialect with feedparser."""
+        import feedparser
+        
+        # Parse from the raw bytes (feedparser detects the encoding itself)
+        feed = feedparser.parse(content)
         
+        if feed.bozo and feed.bozo_exception:
+            logger.warning(f"Feed parsing warning: {feed.bozo_exception}")
+        
+        entries = []
+        for entry in feed.entries:
+            lead = self._parse_entry(entry)
+            if lead:
+                entries.append(lead)
+        return entries
+    
+    def _parse_entry(self, entry) -> Optional[Lead]:
+        """Parse a feedparser entry into a Lead."""
         # Get published date
         published = entry.get("published") or entry.get("pubDate") or entry.get("updated")
         if hasattr(entry, "published_parsed") and entry.published_parsed:
@@ -114,45 +227,58 @@ class GoogleAlertsSource:
             except:
                 pass
         
+        return self._make_lead(
+            title=entry.get("title", ""),
+            link=entry.get("link", ""),
+            description=entry.get("description") or entry.get("summary") or "",
+            published=published,
+        )
+    
+    def _make_lead(self, title: str, link: str, description: str, published: Optional[str]) -> Optional[Lead]:
+        """Build a Lead from parsed entry fields."""
+        if not title or not link:
+            return None
+        
         # Extract location from title/description if possible
         location = self._extract_location(title + " " + description)
         
-        return {
-            "title": title,
-            "url": link,
-            "location": location,
-            "description": description[:500] if description else "",  # Truncate long descriptions
-            "posted_time": published,
-            "source": "google_alerts",
-            "budget": None,
-        }
+        return Lead(
+            title=title,
+            url=link,
+            location=location,
+            description=description[:500] if description else "",  # Truncate long descriptions
+            posted_time=published,
+            source="google_alerts",
+            budget=None,
+        )
     
     def _extract_location(self, text: str) -> str:
         """Extract location from text if Ontario city is mentioned."""
-        ontario_cities = [
-            "Sudbury", "North Bay", "Timmins", "Sault Ste Marie", "Sault Ste. Marie",
-            "Thunder Bay", "Sudbury", "Elliot Lake", "Temiskaming Shores",
-            "Cochrane", "Kirkland Lake", "Hearst", "Kapuskasing", "Smooth Rock Falls",
-            "Ontario", "Toronto", "Ottawa", "Hamilton", "London", "Windsor"
-        ]
-        
-        text_lower = text.lower()
-        for city in ontario_cities:
-            if city.lower() in text_lower:
-                return city
+        # One scan over the text; keep the highest-priority city found
+        best = None
+        for match in _CITY_RE.finditer(text):
+            rank = _CITY_RANK[match.group().lower()]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
+        
+        if best is not None:
+            return _ONTARIO_CITIES[best]
         
         return "Ontario"  # Default location
 
 
-def scrape_google_alerts(config: dict) -> Generator[dict, None, None]:
+def scrape_google_alerts(config: dict) -> Generator[Lead, None, None]:
     """Convenience function to scrape Google Alerts with config."""
     source = GoogleAlertsSource(config)
     yield from source.search()
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper (run from lead-hunter/: python -m sources.google_alerts)
     import json
+    from dataclasses import asdict
     logging.basicConfig(level=logging.INFO)
     
     test_config = {
@@ -166,4 +292,4 @@ if __name__ == "__main__":
     }
     
     for lead in scrape_google_alerts(test_config):
-        print(json.dumps(lead, indent=2))
+        print(json.dumps(asdict(lead), indent=2))
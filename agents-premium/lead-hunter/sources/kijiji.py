@@ -1,18 +1,29 @@
 """
 Kijiji scraper for Lead Hunter agent.
-Uses Playwright (Firefox) for browser automation to bypass blocking.
+Fetches search pages concurrently over plain HTTP and falls back to
+Playwright (Firefox) browser automation when Kijiji blocks the cheap path.
 Searches for renovation and permit-related posts in Ontario cities.
 """
 
+import asyncio
+import html as html_lib
 import logging
-import time
+import random
 import re
-from typing import List, Generator, Optional
+from typing import Dict, List, Generator, Optional, Tuple
 from urllib.parse import urljoin, quote_plus
 from datetime import datetime
+from itertools import islice
+from types import MappingProxyType
 
+import httpx
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, Browser, Page, BrowserContext
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from playwright.async_api import async_playwright, Browser, Page, BrowserContext, Route
+
+from . import _http
+from ._http import USER_AGENT
+from .lead import Lead
 
 logger = logging.getLogger(__name__)
 
@@ -20,26 +31,58 @@ logger = logging.getLogger(__name__)
 KIJIJI_BASE = "https://www.kijiji.ca"
 KIJIJI_SEARCH = "https://www.kijiji.ca/b-{category}/{location}/{query}/k0c{category_code}"
 
+HTTP_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-CA,en;q=0.9",
+}
+
+# Requests the listing HTML never needs; aborted at the browser context
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+BLOCKED_HOSTS = ("doubleclick", "google-analytics", "googletagmanager", "facebook.net", "hotjar")
+
+# Class-name fragments that mark a listing's container element
+_PARENT_CLASS_HINTS = ("item", "card", "listing", "search")
+
+# Precompiled patterns (compiled once at import, reused for every link)
+# Plain <a href="/v-...">title</a> anchors, matched straight off the raw HTML
+_LISTING_RE = re.compile(rb'<a[^>]+href="(/v-[^"]+)"[^>]*>([^<]{5,200})</a>', re.I)
+_PRICE_RE = re.compile(r"\$[\d,]+")
+_DETAIL_DESC_CLASS_RE = re.compile(r"description", re.I)
+_TEL_RE = re.compile(r"tel:")
+
 
 class KijijiScraper:
     """Scrapes Kijiji for renovation and permit-related listings using Playwright."""
     
     # Category mappings
-    CATEGORIES = {
+    CATEGORIES = MappingProxyType({
         "home_renovation": {"slug": "home-renovation-trade-services", "code": "44"},
         "general": {"slug": "general-services", "code": "45"},
         "real_estate": {"slug": "real-estate", "code": "34"},
         "housing": {"slug": "housing", "code": "37"},
-    }
+    })
     
     # Location ID mappings for Ontario cities (for search URL format)
-    LOCATIONS = {
+    LOCATIONS = MappingProxyType({
         "Sudbury": {"path": "sudbury", "code": "l9004"},
         "North Bay": {"path": "north-bay", "code": "l1700027"},
         "Timmins": {"path": "timmins", "code": "l1700028"},
         "Sault Ste Marie": {"path": "sault-ste-marie", "code": "l1700026"},
         "Ontario": {"path": "ontario", "code": "l9004"},  # Broader Ontario search
-    }
+    })
+    
+    # Max simultaneous plain-HTTP search page requests. Each request holds its
+    # slot through a 2-4s pause, so this also caps the request rate (~1/s)
+    HTTP_CONCURRENCY = 2
+    
+    # Number of pre-warmed browser pages (= max concurrent browser fetches)
+    PAGE_POOL_SIZE = 4
+    
+    # Minimum regex matches before trusting the fast (no-DOM) parse
+    FAST_PARSE_MIN_LINKS = 3
+    
+    # How far above a listing link to look for its container
+    MAX_PARENT_DEPTH = 4
     
     def __init__(self, config: dict, headless: bool = True, browser_type: str = "firefox"):
         self.config = config
@@ -47,6 +90,15 @@ class KijijiScraper:
         self.locations = self.search_config.get("locations", list(self.LOCATIONS.keys()))
         self.keywords = self.search_config.get("keywords", [])
         self.max_results = self.search_config.get("max_results_per_query", 50)
+        self.fast_parse = self.search_config.get("kijiji", {}).get("fast_parse", False)
+        
+        # Resolve each configured location (unknown -> broader Ontario) once
+        self._resolved_locs = [
+            self.LOCATIONS.get(location, self.LOCATIONS["Ontario"]) for location in self.locations
+        ]
+        
+        # Search URLs are fixed for the scraper's lifetime; build them once
+        self._query_urls = self._build_query_urls()
         self.headless = headless
         self.browser_type = browser_type
         
@@ -54,64 +106,123 @@ class KijijiScraper:
         self._playwright = None
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
+        self._page_pool: Optional["asyncio.Queue[Page]"] = None
+        self._reset_async_state()
     
-    def _init_browser(self):
-        """Initialize Playwright browser."""
-        if self._browser is not None:
-            return
-        
-        logger.info(f"Initializing {self.browser_type} browser (headless={self.headless})...")
-        self._playwright = sync_playwright().start()
-        
-        if self.browser_type == "firefox":
-            self._browser = self._playwright.firefox.launch(headless=self.headless)
+    def _reset_async_state(self):
+        """Create fresh asyncio primitives (they bind to the loop that first uses them)."""
+        self._browser_lock = asyncio.Lock()
+        # Held across a browser fetch *and* its polite delay, so the number of
+        # slots (not wall time) is what rate-limits Kijiji
+        self._browser_slots = asyncio.Semaphore(self.PAGE_POOL_SIZE)
+    
+    async def _init_browser(self):
+        """Initialize Playwright browser and a pool of reusable pages."""
+        async with self._browser_lock:
+            if self._browser is not None:
+                return
+            
+            logger.info(f"Initializing {self.browser_type} browser (headless={self.headless})...")
+            self._playwright = await async_playwright().start()
+            
+            if self.browser_type == "firefox":
+                self._browser = await self._playwright.firefox.launch(headless=self.headless)
+            else:
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            
+            # Create context with realistic settings
+            self._context = await self._browser.new_context(
+                viewport={"width": 1920, "height": 1080},
+                user_agent=USER_AGENT,
+                locale="en-CA",
+                timezone_id="America/Toronto",
+            )
+            
+            # Block unnecessary resources for every page in the context
+            await self._context.route("**/*", self._route_filter)
+            
+            # Pre-warm pages once and reuse them across fetches
+            self._page_pool = asyncio.Queue()
+            for _ in range(self.PAGE_POOL_SIZE):
+                self._page_pool.put_nowait(await self._context.new_page())
+            
+            logger.info(f"Browser initialized successfully ({self.PAGE_POOL_SIZE} pages)")
+    
+    @staticmethod
+    async def _route_filter(route: Route):
+        """Abort assets and trackers; let documents, scripts and XHR through."""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+            host in request.url for host in BLOCKED_HOSTS
+        ):
+            await route.abort()
         else:
-            self._browser = self._playwright.chromium.launch(headless=self.headless)
-        
-        # Create context with realistic settings
-        self._context = self._browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0",
-            locale="en-CA",
-            timezone_id="America/Toronto",
-        )
-        
-        logger.info("Browser initialized successfully")
+            await route.continue_()
     
-    def _close_browser(self):
+    async def _close_browser(self):
         """Close browser and cleanup."""
+        # Don't carry primitives across runs in case the loop changes
+        self._reset_async_state()
+        if self._browser is None and self._playwright is None:
+            return
+        
+        self._page_pool = None
         if self._context:
-            self._context.close()
+            await self._context.close()
             self._context = None
         if self._browser:
-            self._browser.close()
+            await self._browser.close()
             self._browser = None
         if self._playwright:
-            self._playwright.stop()
+            await self._playwright.stop()
             self._playwright = None
         logger.info("Browser closed")
     
-    def _fetch_page(self, url: str) -> Optional[str]:
-        """Fetch page content using Playwright."""
-        if self._browser is None:
-            self._init_browser()
+    async def _fetch_html_async(self, urls: List[str]) -> List[Optional[bytes]]:
+        """
+        Fetch search pages concurrently over plain HTTP (no browser).
+        Returns raw HTML bytes per URL, or None when the request failed or was blocked.
+        """
+        semaphore = asyncio.Semaphore(self.HTTP_CONCURRENCY)
+        client = _http.get_async_client()
         
-        page: Optional[Page] = None
-        try:
-            page = self._context.new_page()
+        async def fetch(url: str) -> Optional[bytes]:
+            async with semaphore:
+                try:
+                    response = await client.get(url, headers=HTTP_HEADERS)
+                except httpx.HTTPError as e:
+                    logger.warning(f"HTTP fetch failed for {url}: {e}")
+                    return None
+                finally:
+                    # Be polite to Kijiji (the slot stays held, limiting the rate)
+                    await asyncio.sleep(random.uniform(2, 4))
             
-            # Block unnecessary resources to speed up
-            page.route("**/*.{png,jpg,jpeg,gif,svg,woff,woff2}", lambda route: route.abort())
+            # 403/503 usually means a Cloudflare challenge page
+            if response.status_code != 200:
+                logger.debug(f"HTTP fetch of {url} returned status {response.status_code}")
+                return None
             
+            logger.debug(f"Page fetched over HTTP: {len(response.content)} bytes")
+            return response.content
+        
+        return await asyncio.gather(*(fetch(url) for url in urls))
+    
+    async def _fetch_page(self, url: str) -> Optional[bytes]:
+        """Fetch page content using a pooled Playwright page."""
+        if self._browser is None:
+            await self._init_browser()
+        
+        page = await self._page_pool.get()
+        try:
             logger.debug(f"Navigating to: {url}")
-            response = page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
             
             if response and response.status == 200:
                 # Wait for listings to load
-                page.wait_for_selector("div[data-listing-id], div.search-item, article", timeout=10000)
+                await page.wait_for_selector("div[data-listing-id], div.search-item, article", timeout=10000)
                 
                 # Get the HTML content
-                html = page.content()
+                html = (await page.content()).encode("utf-8")
                 logger.debug(f"Page fetched: {len(html)} bytes")
                 return html
             else:
@@ -123,77 +234,117 @@ class KijijiScraper:
             logger.error(f"Error fetching {url}: {e}")
             return None
         finally:
-            if page:
-                page.close()
+            self._page_pool.put_nowait(page)
     
-    def search(self) -> Generator[dict, None, None]:
+    def search(self) -> Generator[Lead, None, None]:
         """
         Execute all search queries and yield results.
-        Each result is a dict representing a lead.
+        Each result is a Lead.
         """
+        queries: List[Tuple[str, str, str]] = [
+            (keyword, location, url)
+            for (location, keyword), url in self._query_urls.items()
+        ]
+        if not queries:
+            return
+        
+        query_results = _http.run(self._run_queries(queries))
+        
+        seen_urls = set()
+        
+        for results in query_results:
+            for result in results:
+                # Dedupe by URL
+                if result.url in seen_urls:
+                    logger.debug(f"Skipping duplicate: {result.url}")
+                    continue
+                seen_urls.add(result.url)
+                yield result
+    
+    async def _run_queries(self, queries: List[Tuple[str, str, str]]) -> List[List[Lead]]:
+        """Prefetch all search pages over HTTP, then parse (with browser fallback)."""
+        logger.info(f"Fetching {len(queries)} search pages over HTTP...")
+        pages = await self._fetch_html_async([url for _, _, url in queries])
+        
         try:
-            self._init_browser()
-            seen_urls = set()
-            
-            for location in self.locations:
-                for keyword in self.keywords:
-                    logger.info(f"Searching: '{keyword}' in {location}")
-                    
-                    try:
-                        results = self._search_query(keyword, location)
-                        for result in results:
-                            # Dedupe by URL
-                            if result["url"] not in seen_urls:
-                                seen_urls.add(result["url"])
-                                yield result
-                            else:
-                                logger.debug(f"Skipping duplicate: {result['url']}")
-                        
-                        # Be polite to Kijiji
-                        time.sleep(3)
-                        
-                    except Exception as e:
-                        logger.error(f"Error searching '{keyword}' in {location}: {e}")
-                        continue
+            results = await asyncio.gather(*(
+                self._search_query(keyword, location, url, html)
+                for (keyword, location, url), html in zip(queries, pages)
+            ), return_exceptions=True)
         finally:
-            self._close_browser()
+            await self._close_browser()
+        
+        query_results = []
+        for (keyword, location, _), result in zip(queries, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error searching '{keyword}' in {location}: {result}")
+                result = []
+            query_results.append(result)
+        return query_results
     
-    def _search_query(self, keyword: str, location: str) -> List[dict]:
-        """Execute a single search query and parse results."""
-        results = []
+    def _build_query_urls(self) -> Dict[Tuple[str, str], str]:
+        """Build the Kijiji search URL for every (location, keyword) pair."""
+        quoted = {keyword: quote_plus(keyword) for keyword in self.keywords}
+        urls = {}
         
-        # Build search URL using Kijiji search format
-        loc_info = self.LOCATIONS.get(location, self.LOCATIONS["Ontario"])
+        for location, loc_info in zip(self.locations, self._resolved_locs):
+            # Use Kijiji's search URL format: /b-{location}/{query}/k0{locationCode}?dc=true
+            prefix = f"{KIJIJI_BASE}/b-{loc_info['path']}/"
+            suffix = f"/k0{loc_info['code']}?dc=true"
+            for keyword in self.keywords:
+                urls[(location, keyword)] = prefix + quoted[keyword] + suffix
         
-        # Use Kijiji's search URL format: /b-{location}/{query}/k0{locationCode}?dc=true
-        url = f"https://www.kijiji.ca/b-{loc_info['path']}/{quote_plus(keyword)}/k0{loc_info['code']}?dc=true"
-        logger.info(f"Fetching: {url}")
+        return urls
+    
+    async def _search_query(self, keyword: str, location: str, url: str, html: Optional[bytes] = None) -> List[Lead]:
+        """
+        Parse a single search query's results.
+        Uses the prefetched HTML when it contains listings, otherwise
+        falls back to rendering the page with a pooled Playwright page.
+        """
+        logger.info(f"Searching: '{keyword}' in {location}")
+        results = []
         
         try:
-            html = self._fetch_page(url)
             if html:
-                listings = self._parse_search_results(html, location)
-                results.extend(listings)
+                results = self._parse_search_results(html, location)
+            
+            if not results:
+                logger.info(f"No listings over HTTP, falling back to browser: {url}")
+                async with self._browser_slots:
+                    html = await self._fetch_page(url)
+                    if html:
+                        results = self._parse_search_results(html, location)
+                    
+                    # Be polite to Kijiji
+                    await asyncio.sleep(random.uniform(2, 4))
+                
         except Exception as e:
-            logger.warning(f"Request failed for {url}: {e}")
+            logger.error(f"Error searching '{keyword}' in {location}: {e}")
         
         return results[:self.max_results]
     
-    def _parse_search_results(self, html: str, location: str) -> List[dict]:
+    def _parse_search_results(self, html: bytes, location: str) -> List[Lead]:
         """Parse Kijiji search results HTML."""
+        if self.fast_parse:
+            results = self._parse_search_results_fast(html, location)
+            if results:
+                return results
+        
         results = []
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
         
         # Find listing links - Kijiji uses /v- prefix for individual listings
-        listing_links = soup.find_all("a", href=re.compile(r"/v-"))
+        listing_links = tree.css("a[href*='/v-']")
         logger.debug(f"Found {len(listing_links)} listing links")
         
         seen_urls = set()
-        for link in listing_links[:self.max_results * 2]:  # Look at more to account for duplicates
+        # Look at more than max_results to account for duplicates, without copying the list
+        for link in islice(listing_links, self.max_results * 2):
             try:
                 lead = self._parse_listing_link(link, location)
-                if lead and lead["url"] not in seen_urls:
-                    seen_urls.add(lead["url"])
+                if lead and lead.url not in seen_urls:
+                    seen_urls.add(lead.url)
                     results.append(lead)
                     if len(results) >= self.max_results:
                         break
@@ -203,13 +354,72 @@ class KijijiScraper:
         
         return results
     
-    def _parse_listing_link(self, link, location: str) -> dict:
+    def _parse_search_results_fast(self, html: bytes, location: str) -> List[Lead]:
+        """
+        Extract (href, title) pairs with a single regex scan of the raw HTML.
+        Returns an empty list when too few anchors match (markup changed),
+        so the caller can fall back to the DOM parse.
+        """
+        results = []
+        seen_urls = set()
+        matched = 0
+        
+        # Stop scanning the page as soon as the cap is reached
+        for match in _LISTING_RE.finditer(html):
+            matched += 1
+            lead = self._make_lead(match.group(1), match.group(2), location)
+            if lead and lead.url not in seen_urls:
+                seen_urls.add(lead.url)
+                results.append(lead)
+                if len(results) >= self.max_results:
+                    break
+        
+        if len(results) < self.max_results and matched < self.FAST_PARSE_MIN_LINKS:
+            return []
+        
+        logger.debug(f"Fast parse matched {matched} listing links")
+        return results
+    
+    def _make_lead(self, href: bytes, title: bytes, location: str) -> Optional[Lead]:
+        """Build a lead from a raw anchor href and text (no surrounding metadata)."""
+        title = html_lib.unescape(title.decode("utf-8", "replace")).strip()
+        if len(title) < 5:
+            return None
+        
+        return Lead(
+            title=title,
+            url=urljoin(KIJIJI_BASE, html_lib.unescape(href.decode("utf-8", "replace"))),
+            location=location,
+            description="",
+            source="kijiji",
+        )
+    
+    def _find_container(self, link: LexborNode) -> Optional[LexborNode]:
+        """
+        Single bounded climb for the listing's container: the nearest div whose
+        class looks like a listing card, else the nearest <article>.
+        """
+        article = None
+        node = link.parent
+        for _ in range(self.MAX_PARENT_DEPTH):
+            if node is None:
+                break
+            if node.tag == "div":
+                classes = (node.attributes.get("class") or "").lower()
+                if any(hint in classes for hint in _PARENT_CLASS_HINTS):
+                    return node
+            elif node.tag == "article" and article is None:
+                article = node
+            node = node.parent
+        return article
+    
+    def _parse_listing_link(self, link: LexborNode, location: str) -> Optional[Lead]:
         """Parse a single listing link element."""
         # Get title from link text
-        title = link.get_text(strip=True)
+        title = link.text(strip=True)
         
         # Get URL
-        href = link.get("href", "")
+        href = link.attributes.get("href") or ""
         if href.startswith("/"):
             url = urljoin(KIJIJI_BASE, href)
         else:
@@ -219,45 +429,50 @@ class KijijiScraper:
             return None
         
         # Try to get parent container for more context
-        parent = link.find_parent("div", class_=re.compile(r"(item|card|listing|search)", re.I))
-        if not parent:
-            parent = link.find_parent("article")
+        parent = self._find_container(link)
         
         # Extract description from nearby elements
         description = ""
         if parent:
-            desc_elem = parent.find("p") or parent.find("div", class_=re.compile(r"desc", re.I))
+            desc_elem = parent.css_first("p") or parent.css_first("div[class*=desc i]")
             if desc_elem:
-                description = desc_elem.get_text(strip=True)
+                description = desc_elem.text(strip=True)
         
         # Extract price/budget
         budget = None
         if parent:
-            price_text = parent.find(string=re.compile(r"\$[\d,]+"))
-            if price_text:
-                budget = price_text.strip()
+            for node in parent.traverse(include_text=True):
+                if node.tag == "-text":
+                    price_text = node.text(deep=False)
+                    if _PRICE_RE.search(price_text):
+                        budget = price_text.strip()
+                        break
         
         # Extract location from listing if available
         listing_location = location
         if parent:
-            loc_elem = parent.find("span", class_=re.compile(r"location", re.I))
+            loc_elem = parent.css_first("span[class*=location i]")
             if loc_elem:
-                listing_location = loc_elem.get_text(strip=True) or location
+                listing_location = loc_elem.text(strip=True) or location
         
-        return {
-            "title": title,
-            "url": url,
-            "location": listing_location,
-            "description": description,
-            "budget": budget,
-            "posted_time": None,  # Would need to fetch individual page
-            "source": "kijiji",
-        }
+        return Lead(
+            title=title,
+            url=url,
+            location=listing_location,
+            description=description,
+            budget=budget,
+            posted_time=None,  # Would need to fetch individual page
+            source="kijiji",
+        )
     
     def get_listing_details(self, url: str) -> dict:
         """Fetch full details of a specific listing."""
+        return _http.run(self._get_listing_details(url))
+    
+    async def _get_listing_details(self, url: str) -> dict:
+        """Fetch and parse a listing page with the browser."""
         try:
-            html = self._fetch_page(url)
+            html = await self._fetch_page(url)
             if not html:
                 return {}
             
@@ -266,13 +481,13 @@ class KijijiScraper:
             # Extract full description
             desc_elem = (
                 soup.find("div", {"itemprop": "description"}) or
-                soup.find("div", class_=re.compile(r"description", re.I))
+                soup.find("div", class_=_DETAIL_DESC_CLASS_RE)
             )
             description = desc_elem.get_text(strip=True) if desc_elem else ""
             
             # Extract contact info (if available publicly)
             contact = {}
-            phone_elem = soup.find("a", href=re.compile(r"tel:"))
+            phone_elem = soup.find("a", href=_TEL_RE)
             if phone_elem:
                 contact["phone"] = phone_elem.get("href").replace("tel:", "")
             
@@ -284,17 +499,20 @@ class KijijiScraper:
         except Exception as e:
             logger.error(f"Failed to fetch listing details: {e}")
             return {}
+        finally:
+            await self._close_browser()
 
 
-def scrape_kijiji(config: dict, headless: bool = True, browser_type: str = "firefox") -> Generator[dict, None, None]:
+def scrape_kijiji(config: dict, headless: bool = True, browser_type: str = "firefox") -> Generator[Lead, None, None]:
     """Convenience function to scrape Kijiji with config."""
     scraper = KijijiScraper(config, headless=headless, browser_type=browser_type)
     yield from scraper.search()
 
 
 if __name__ == "__main__":
-    # Test the scraper
+    # Test the scraper (run from lead-hunter/: python -m sources.kijiji)
     import json
+    from dataclasses import asdict
     logging.basicConfig(level=logging.INFO)
     
     test_config = {
@@ -307,4 +525,4 @@ if __name__ == "__main__":
     
     print("Testing Playwright-based Kijiji scraper...")
     for lead in scrape_kijiji(test_config, headless=True):
-        print(json.dumps(lead, indent=2))
+        print(json.dumps(asdict(lead), indent=2))
@@ -0,0 +1,68 @@
+"""
+Lead record shared by all Lead Hunter sources.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True, frozen=True)
+class Lead:
+    """Represents a discovered lead (what every source yields)."""
+    title: str
+    url: str
+    location: str
+    description: str
+    posted_time: Optional[str] = None
+    budget: Optional[str] = None
+    source: str = "kijiji"
+    content: str = ""
+    feed_title: str = ""
+    feed_url: str = ""
+    
+    def to_notification(self) -> str:
+        """Format lead as WhatsApp notification message."""
+        lines = [
+            f"🏠 New Lead: {self.title}",
+            f"📍 Location: {self.location}",
+            f"🔗 Link: {self.url}",
+        ]
+        
+        if self.budget:
+            lines.append(f"💰 Budget: {self.budget}")
+        
+        # Truncate description to ~200 chars for readability
+        desc = self.description[:200] + "..." if len(self.description) > 200 else self.description
+        lines.append(f"📝 Description: {desc}")
+        
+        if self.posted_time:
+            lines.append(f"⏰ Posted: {self.posted_time}")
+        
+        lines.append(f"🔍 Source: {self.source}")
+        
+        return "\n".join(lines)
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for storage."""
+        return {
+            "title": self.title,
+            "url": self.url,
+            "location": self.location,
+            "description": self.description,
+            "posted_time": self.posted_time,
+            "budget": self.budget,
+            "source": self.source,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Lead":
+        """Create Lead from dictionary."""
+        return cls(
+            title=data["title"],
+            url=data["url"],
+            location=data["location"],
+            description=data["description"],
+            posted_time=data.get("posted_time"),
+            budget=data.get("budget"),
+            source=data.get("source", "kijiji"),
+        )
@@ -3,15 +3,26 @@ RSS/Atom feed parser for Lead Hunter agent.
 Supports Google Alerts and generic RSS feeds.
 """
 
+import asyncio
 import feedparser
+import httpx
 import logging
-import re
-from typing import List, Generator
-from datetime import datetime
-from dateutil import parser as date_parser
+from io import BytesIO
+from typing import List, Generator, Optional, Union
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from lxml import etree
+
+from . import _http
+from .lead import Lead
+from .rss_hot import clean_summary, extract_location, keyword_hit
 
 logger = logging.getLogger(__name__)
 
+HTTP_HEADERS = {
+    "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml, */*",
+}
+
 # Default keywords to filter for construction/permit leads
 DEFAULT_KEYWORDS = [
     "permit",
@@ -30,6 +41,11 @@ DEFAULT_KEYWORDS = [
     "drawings",
 ]
 
+# XML namespaces for the lxml fast path
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
 
 class RSSScraper:
     """Parses RSS/Atom feeds for renovation and permit-related leads."""
@@ -41,45 +57,166 @@ class RSSScraper:
         self.keywords = self.rss_config.get("keywords", config.get("search", {}).get("keywords", DEFAULT_KEYWORDS))
         self.max_entries_per_feed = self.rss_config.get("max_entries_per_feed", 50)
         
-        # Compile keyword regex for filtering
-        keyword_pattern = "|".join(re.escape(kw) for kw in self.keywords)
-        self.keyword_regex = re.compile(keyword_pattern, re.IGNORECASE)
+        # Lowercased keywords for plain substring filtering
+        self._keywords_lower = tuple(kw.lower() for kw in self.keywords)
     
-    def search(self) -> Generator[dict, None, None]:
+    def search(self) -> Generator[Lead, None, None]:
         """
         Parse all RSS feeds and yield filtered entries.
-        Each result is a dict representing a lead.
+        Each result is a Lead.
         """
         if not self.feeds:
             logger.warning("No RSS feeds configured in agent.toml [rss.feeds]")
             return
         
-        for feed_url in self.feeds:
-            # Skip commented/placeholder URLs
-            feed_url = feed_url.strip()
-            if not feed_url or feed_url.startswith("#"):
-                continue
-            
+        # Skip commented/placeholder URLs
+        feed_urls = [url.strip() for url in self.feeds]
+        feed_urls = [url for url in feed_urls if url and not url.startswith("#")]
+        if not feed_urls:
+            return
+        
+        # Download every feed concurrently, then parse sequentially
+        responses = _http.run(self._fetch_all_feeds(feed_urls))
+        
+        for feed_url, response in zip(feed_urls, responses):
             logger.info(f"Parsing RSS feed: {feed_url}")
             
+            if isinstance(response, Exception):
+                logger.error(f"Error fetching feed {feed_url}: {response}")
+                continue
+            if response.status_code != 200:
+                logger.error(f"Error fetching feed {feed_url}: status {response.status_code}")
+                continue
+            
             try:
-                entries = self._parse_feed(feed_url)
-                for entry in entries:
-                    if self._matches_keywords(entry):
-                        yield self._format_lead(entry, feed_url)
-                    else:
-                        logger.debug(f"Entry doesn't match keywords: {entry.get('title', 'No title')}")
-                        
+                # Entries are already keyword-filtered during parsing
+                for entry in self._parse_feed(feed_url, response.content):
+                    yield self._format_lead(entry, feed_url)
+                    
             except Exception as e:
                 logger.error(f"Error parsing feed {feed_url}: {e}")
                 continue
     
-    def _parse_feed(self, feed_url: str) -> List[dict]:
-        """Parse a single RSS/Atom feed and return entries."""
+    async def _fetch_all_feeds(self, feed_urls: List[str]) -> List[Union[httpx.Response, Exception]]:
+        """Download all feed bodies concurrently (exceptions are returned, not raised)."""
+        client = _http.get_async_client()
+        return await asyncio.gather(
+            *(client.get(url, headers=HTTP_HEADERS, timeout=15) for url in feed_urls),
+            return_exceptions=True,
+        )
+    
+    def _parse_feed(self, feed_url: str, content: bytes) -> List[dict]:
+        """Parse a single downloaded RSS/Atom feed and return entries."""
+        entries = self._parse_feed_fast(feed_url, content)
+        if entries is None:
+            entries = self._parse_feed_feedparser(feed_url, content)
+        return entries
+    
+    def _parse_feed_fast(self, feed_url: str, content: bytes) -> Optional[List[dict]]:
+        """
+        Stream RSS 2.0 <item> / Atom <entry> elements with lxml.
+        Returns None for malformed or unrecognized feeds so the caller
+        can fall back to feedparser.
+        """
+        entries = []
+        seen = 0
+        feed_title = None
+        context = etree.iterparse(
+            BytesIO(content),
+            events=("end",),
+            tag=("item", _ATOM + "entry"),
+            resolve_entities=False,
+        )
+        
+        try:
+            for _, elem in context:
+                if feed_title is None:
+                    # Channel/feed title precedes the first item
+                    root = elem.getroottree().getroot()
+                    feed_title = (
+                        root.findtext("channel/title")
+                        or root.findtext(_ATOM + "title")
+                        or "Unknown Feed"
+                    ).strip()
+                
+                if elem.tag == "item":
+                    fields = self._rss_item_fields(elem)
+                else:
+                    fields = self._atom_entry_fields(elem)
+                title, link, summary, body, date_str = fields
+                seen += 1
+                
+                # Keyword gate before the content/date work and dict build
+                title = title.strip()
+                summary = clean_summary(summary)
+                if keyword_hit(f"{title} {summary}", self._keywords_lower):
+                    entries.append({
+                        "title": title,
+                        "link": link.strip(),
+                        "summary": summary,
+                        "content": clean_summary(body),
+                        "published": self._normalize_date(date_str.strip()) if date_str else "",
+                        "feed_title": feed_title,
+                        "feed_url": feed_url,
+                    })
+                else:
+                    logger.debug(f"Entry doesn't match keywords: {title or 'No title'}")
+                
+                # Free parsed elements as we go
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+                
+                if seen >= self.max_entries_per_feed:
+                    break
+                    
+        except etree.XMLSyntaxError as e:
+            logger.debug(f"Fast parse failed for {feed_url}, using feedparser: {e}")
+            return None
+        
+        if not seen:
+            return None
+        
+        logger.info(f"Parsed {seen} entries from {feed_title} ({len(entries)} matching)")
+        return entries
+    
+    @staticmethod
+    def _rss_item_fields(item) -> tuple:
+        """Return (title, link, summary, content, date) from an RSS <item>."""
+        summary = item.findtext("description", "")
+        return (
+            item.findtext("title", ""),
+            item.findtext("link", ""),
+            summary,
+            item.findtext(_CONTENT_ENCODED) or summary,
+            item.findtext("pubDate") or item.findtext(_DC_DATE),
+        )
+    
+    @staticmethod
+    def _atom_entry_fields(entry) -> tuple:
+        """Return (title, link, summary, content, date) from an Atom <entry>."""
+        link = ""
+        for link_elem in entry.iterfind(_ATOM + "link"):
+            if link_elem.get("rel", "alternate") == "alternate":
+                link = link_elem.get("href", "")
+                break
+        
+        body = entry.findtext(_ATOM + "content")
+        summary = entry.findtext(_ATOM + "summary") or body or ""
+        return (
+            entry.findtext(_ATOM + "title", ""),
+            link,
+            summary,
+            body or summary,
+            entry.findtext(_ATOM + "published") or entry.findtext(_ATOM + "updated"),
+        )
+    
+    def _parse_feed_feedparser(self, feed_url: str, content: bytes) -> List[dict]:
+        """Parse a feed with feedparser (handles every dialect, but slowly)."""
         entries = []
         
         # feedparser handles both RSS and Atom formats automatically
-        feed = feedparser.parse(feed_url)
+        feed = feedparser.parse(content)
         
         if feed.bozo and feed.bozo_exception:
             logger.warning(f"Feed parsing warning for {feed_url}: {feed.bozo_exception}")
@@ -91,10 +228,17 @@ class RSSScraper:
         feed_title = feed.feed.get("title", "Unknown Feed")
         
         for entry in feed.entries[:self.max_entries_per_feed]:
+            # Keyword gate before the content/date work and dict build
+            title = entry.get("title", "")
+            summary = clean_summary(entry.get("summary", ""))
+            if not keyword_hit(f"{title} {summary}", self._keywords_lower):
+                logger.debug(f"Entry doesn't match keywords: {title or 'No title'}")
+                continue
+            
             parsed_entry = {
-                "title": entry.get("title", ""),
+                "title": title,
                 "link": entry.get("link", ""),
-                "summary": self._clean_summary(entry.get("summary", "")),
+                "summary": summary,
                 "content": self._extract_content(entry),
                 "published": self._parse_date(entry),
                 "feed_title": feed_title,
@@ -102,24 +246,9 @@ class RSSScraper:
             }
             entries.append(parsed_entry)
         
-        logger.info(f"Parsed {len(entries)} entries from {feed_title}")
+        logger.info(f"Parsed {len(feed.entries[:self.max_entries_per_feed])} entries from {feed_title} ({len(entries)} matching)")
         return entries
     
-    def _clean_summary(self, summary: str) -> str:
-        """Clean HTML and extra whitespace from summary."""
-        if not summary:
-            return ""
-        
-        # Remove HTML tags
-        summary = re.sub(r'<[^>]+>', '', summary)
-        # Collapse whitespace
-        summary = re.sub(r'\s+', ' ', summary).strip()
-        # Truncate if too long
-        if len(summary) > 500:
-            summary = summary[:497] + "..."
-        
-        return summary
-    
     def _extract_content(self, entry) -> str:
         """Extract full content from entry if available."""
         content = ""
@@ -134,7 +263,7 @@ class RSSScraper:
         elif hasattr(entry, "summary"):
             content = entry.summary
         
-        return self._clean_summary(content)
+        return clean_summary(content)
     
     def _parse_date(self, entry) -> str:
         """Parse and normalize publication date."""
@@ -147,69 +276,72 @@ class RSSScraper:
                 if date_str:
                     break
         
-        if not date_str:
-            return ""
+        # Same normalization as the lxml path, keeping the feed's UTC offset
+        if date_str:
+            iso = self._to_iso(date_str)
+            if iso:
+                return iso
         
-        try:
-            # dateutil parser handles most formats
-            dt = date_parser.parse(date_str)
-            return dt.isoformat()
-        except Exception as e:
-            logger.debug(f"Failed to parse date '{date_str}': {e}")
-            return date_str
+        # feedparser understands more formats, but only gives a UTC struct_time
+        for field in ["published_parsed", "updated_parsed", "created_parsed"]:
+            parsed = getattr(entry, field, None)
+            if parsed:
+                return datetime(*parsed[:6], tzinfo=timezone.utc).isoformat()
+        
+        return date_str or ""
     
-    def _matches_keywords(self, entry: dict) -> bool:
-        """Check if entry matches any configured keywords."""
-        # Search in title and summary
-        searchable_text = f"{entry.get('title', '')} {entry.get('summary', '')}"
+    def _normalize_date(self, date_str: str) -> str:
+        """Convert a raw date string to ISO 8601 (returned unchanged if unparseable)."""
+        return self._to_iso(date_str) or date_str
+    
+    @staticmethod
+    def _to_iso(date_str: str) -> Optional[str]:
+        """Parse an RFC 822 or ISO 8601 date string to ISO 8601, or None."""
+        # RSS pubDate (RFC 822)
+        try:
+            return parsedate_to_datetime(date_str).isoformat()
+        except (TypeError, ValueError):
+            pass
         
-        return bool(self.keyword_regex.search(searchable_text))
+        # Atom published/updated (ISO 8601)
+        try:
+            if date_str.endswith("Z"):
+                date_str_iso = date_str[:-1] + "+00:00"
+            else:
+                date_str_iso = date_str
+            return datetime.fromisoformat(date_str_iso).isoformat()
+        except ValueError as e:
+            logger.debug(f"Failed to parse date '{date_str}': {e}")
+            return None
     
-    def _format_lead(self, entry: dict, feed_url: str) -> dict:
-        """Format RSS entry as a lead dict."""
+    def _format_lead(self, entry: dict, feed_url: str) -> Lead:
+        """Format RSS entry as a Lead."""
         # Extract potential location from title/summary
-        location = self._extract_location(entry)
-        
-        return {
-            "title": entry.get("title", "Untitled"),
-            "url": entry.get("link", ""),
-            "location": location,
-            "description": entry.get("summary", ""),
-            "content": entry.get("content", ""),
-            "posted_time": entry.get("published", ""),
-            "source": "rss",
-            "feed_title": entry.get("feed_title", ""),
-            "feed_url": feed_url,
-        }
-    
-    def _extract_location(self, entry: dict) -> str:
-        """Try to extract location from entry content."""
-        # Common Ontario location patterns
-        location_patterns = [
-            r"\b(Sudbury|North Bay|Timmins|Sault Ste\.? Marie)\b",
-            r"\b(Toronto|Ottawa|Hamilton|London|Kingston)\b",
-            r"\b(Ontario|ON)\b",
-        ]
-        
-        text = f"{entry.get('title', '')} {entry.get('summary', '')}"
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        return "Unknown"
+        location = extract_location(f"{entry.get('title', '')} {entry.get('summary', '')}")
+        
+        return Lead(
+            title=entry.get("title", "Untitled"),
+            url=entry.get("link", ""),
+            location=location,
+            description=entry.get("summary", ""),
+            content=entry.get("content", ""),
+            posted_time=entry.get("published", ""),
+            source="rss",
+            feed_title=entry.get("feed_title", ""),
+            feed_url=feed_url,
+        )
 
 
-def scrape_rss(config: dict) -> Generator[dict, None, None]:
+def scrape_rss(config: dict) -> Generator[Lead, None, None]:
     """Convenience function to scrape RSS feeds with config."""
     scraper = RSSScraper(config)
     yield from scraper.search()
 
 
 if __name__ == "__main__":
-    # Test the parser
+    # Test the parser (run from lead-hunter/: python -m sources.rss)
     import json
+    from dataclasses import asdict
     logging.basicConfig(level=logging.INFO)
     
     test_config = {
@@ -225,4 +357,4 @@ if __name__ == "__main__":
     }
     
     for lead in scrape_rss(test_config):
-        print(json.dumps(lead, indent=2))
+        print(json.dumps(asdict(lead), indent=2))
@@ -0,0 +1,81 @@
+"""
+Hot-path text helpers for the RSS parser.
+
+Pure, IO-free and fully typed so the module can be compiled with mypyc
+(`mypyc sources/rss_hot.py`) or Cython. The compiled extension is picked up by
+the normal `from .rss_hot import ...`; without it this plain module is used.
+"""
+
+import re
+from typing import Dict, Final, Optional, Tuple
+
+# Precompiled patterns (compiled once at import, reused for every entry)
+_TAG_RE: Final = re.compile(r"<[^>]+>")
+_WS_RE: Final = re.compile(r"\s+")
+# Whitespace _WS_RE would change: a run of 2+, or any single non-space whitespace
+_WS_COLLAPSE_RE: Final = re.compile(r"\s\s|[^\S ]")
+
+# Common Ontario location patterns fused into a single alternation.
+# Group order is the match priority: northern cities > major cities > province.
+_LOC_RE: Final = re.compile(
+    r"\b(?P<north>Sudbury|North Bay|Timmins|Sault Ste\.? Marie)\b"
+    r"|\b(?P<major>Toronto|Ottawa|Hamilton|London|Kingston)\b"
+    r"|\b(?P<prov>Ontario|ON)\b",
+    re.IGNORECASE,
+)
+_LOC_PRIORITY: Final[Dict[str, int]] = {"north": 0, "major": 1, "prov": 2}
+
+MAX_SUMMARY_LEN: Final = 500
+
+
+def clean_summary(summary: str) -> str:
+    """Clean HTML and extra whitespace from summary."""
+    if not summary:
+        return ""
+    
+    # Fast path: short plain text needs no regex work
+    if (
+        len(summary) < MAX_SUMMARY_LEN
+        and "<" not in summary
+        and not _WS_COLLAPSE_RE.search(summary)
+    ):
+        return summary.strip()
+    
+    # Remove HTML tags
+    summary = _TAG_RE.sub("", summary)
+    # Collapse whitespace
+    summary = _WS_RE.sub(" ", summary).strip()
+    # Truncate if too long
+    if len(summary) > MAX_SUMMARY_LEN:
+        summary = summary[:MAX_SUMMARY_LEN - 3] + "..."
+    
+    return summary
+
+
+def keyword_hit(text: str, keywords_lower: Tuple[str, ...]) -> bool:
+    """Case-insensitive substring test of text against lowercased keywords."""
+    text = text.lower()
+    for kw in keywords_lower:
+        if kw in text:
+            return True
+    return False
+
+
+def extract_location(text: str) -> str:
+    """Return the highest-priority Ontario location mentioned in text, or "Unknown"."""
+    # Single scan; keep the highest-priority group seen
+    best: Optional[str] = None
+    best_priority = len(_LOC_PRIORITY)
+    for match in _LOC_RE.finditer(text):
+        group = match.lastgroup or ""
+        if group == "north":
+            return match.group()
+        priority = _LOC_PRIORITY[group]
+        if priority < best_priority:
+            best = match.group()
+            best_priority = priority
+    
+    if best is not None:
+        return best
+    
+    return "Unknown"